@@ -1 +1,3 @@
 # __init__.py - part of genai_scaffold
+
+__version__ = "0.2.0"
@@ -2,7 +2,23 @@
 Entry point for the genai_scaffold CLI.
 """
 
-from .cli import main
+import sys
+
+from . import __version__
+
+_VERSION_ARGS = ("version", "--version", "-V")
+
+
+def main():
+    """Run the CLI, answering version queries without loading Typer or Rich."""
+    if len(sys.argv) == 2 and sys.argv[1] in _VERSION_ARGS:
+        sys.stdout.write(f"genai-scaffold version {__version__}\n")
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
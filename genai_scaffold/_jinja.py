@@ -0,0 +1,47 @@
+"""Shared Jinja2 environment for template rendering."""
+
+from functools import lru_cache
+from jinja2 import Environment, FileSystemLoader, Template
+
+
+@lru_cache(maxsize=None)
+def get_env(
+    templates_dir: str, trim_blocks: bool = True, lstrip_blocks: bool = True
+) -> Environment:
+    """Return the Jinja2 environment for a templates directory.
+
+    The environment is built on first use and reused afterwards, so the
+    loader and compiled templates are shared by every caller asking for the
+    same whitespace options.
+
+    Args:
+        templates_dir: Path to the directory containing the templates
+        trim_blocks: Remove the first newline after a block tag
+        lstrip_blocks: Strip whitespace before a block tag on its line
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=False,
+        trim_blocks=trim_blocks,
+        lstrip_blocks=lstrip_blocks,
+        cache_size=-1,
+        auto_reload=False,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_template(
+    templates_dir: str, name: str, trim_blocks: bool = True, lstrip_blocks: bool = True
+) -> Template:
+    """Return the compiled template ``name`` from ``templates_dir``.
+
+    Templates are static, so each one is loaded and compiled once per
+    process and then served straight from this cache.
+
+    Args:
+        templates_dir: Path to the directory containing the templates
+        name: Template name relative to the templates directory
+        trim_blocks: Remove the first newline after a block tag
+        lstrip_blocks: Strip whitespace before a block tag on its line
+    """
+    return get_env(templates_dir, trim_blocks, lstrip_blocks).get_template(name)
@@ -4,13 +4,9 @@ from pathlib import Path
 from typing import Optional
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from InquirerPy import prompt
-from InquirerPy.base.control import Choice
 
+from . import __version__
 from .core.config import ProjectConfig
-from .generators.project_generator import ProjectGenerator
 
 app = typer.Typer(
     name="genai-scaffold",
@@ -20,8 +16,37 @@ app = typer.Typer(
 console = Console()
 
 
+def _print_version() -> None:
+    """Print the version line."""
+    console.print(f"[bold cyan]genai-scaffold[/bold cyan] version [green]{__version__}[/green]")
+
+
+def _version_callback(value: bool) -> None:
+    """Handle the eager --version/-V option."""
+    if value:
+        _print_version()
+        raise typer.Exit()
+
+
+@app.callback()
+def _app_options(
+    version: Optional[bool] = typer.Option(
+        None,
+        "--version",
+        "-V",
+        callback=_version_callback,
+        is_eager=True,
+        help="Show version information and exit"
+    ),
+):
+    """Interactive CLI tool to scaffold production-ready Generative AI projects"""
+
+
 def interactive_config() -> ProjectConfig:
     """Prompt user for project configuration interactively."""
+    from InquirerPy import prompt
+    from InquirerPy.base.control import Choice
+
     console.print("\n[bold cyan]🚀 GenAI Project Scaffold - Interactive Setup[/bold cyan]\n")
     
     questions = [
@@ -103,28 +128,22 @@ def interactive_config() -> ProjectConfig:
             "message": "Enable observability/tracing?",
             "default": False,
         },
+        {
+            # Only asked when observability is enabled
+            "type": "list",
+            "name": "observability_tool",
+            "message": "Select Observability Tool:",
+            "choices": [
+                Choice(value="langsmith", name="LangSmith"),
+                Choice(value="wandb", name="Weights & Biases"),
+            ],
+            "default": "langsmith",
+            "when": lambda ans: ans.get("enable_observability"),
+        },
     ]
     
     answers = prompt(questions)
     
-    # If observability is enabled, ask which tool
-    observability_tool = None
-    if answers["enable_observability"]:
-        obs_question = [
-            {
-                "type": "list",
-                "name": "observability_tool",
-                "message": "Select Observability Tool:",
-                "choices": [
-                    Choice(value="langsmith", name="LangSmith"),
-                    Choice(value="wandb", name="Weights & Biases"),
-                ],
-                "default": "langsmith",
-            }
-        ]
-        obs_answer = prompt(obs_question)
-        observability_tool = obs_answer["observability_tool"]
-    
     return ProjectConfig(
         project_name=answers["project_name"],
         llm_provider=answers["llm_provider"],
@@ -134,7 +153,7 @@ def interactive_config() -> ProjectConfig:
         dependency_manager=answers["dependency_manager"],
         enable_docker=answers["enable_docker"],
         enable_observability=answers["enable_observability"],
-        observability_tool=observability_tool,
+        observability_tool=answers.get("observability_tool"),
     )
 
 
@@ -219,6 +238,11 @@ def create(
             observability_tool=None,
         )
     
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from .generators.project_generator import ProjectGenerator
+
     # Display configuration
     console.print("\n[bold green]📋 Project Configuration:[/bold green]")
     config_panel = Panel(
@@ -306,7 +330,7 @@ def create(
 @app.command()
 def version():
     """Show version information."""
-    console.print("[bold cyan]genai-scaffold[/bold cyan] version [green]0.2.0[/green]")
+    _print_version()
 
 
 def main():
@@ -1,10 +1,31 @@
 """Configuration models for project generation."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import FrozenSet, Optional, Tuple
 
+_VALID_LLM_PROVIDERS = frozenset({"openai", "anthropic", "azure", "ollama", "local"})
+_VALID_ORCHESTRATORS = frozenset({"langchain", "llamaindex", "dspy", "none"})
+_VALID_VECTOR_DBS = frozenset({"pinecone", "chromadb", "qdrant", "pgvector"})
+_VALID_UI_FRAMEWORKS = frozenset({"streamlit", "gradio", "fastapi", "none"})
+_VALID_DEPENDENCY_MANAGERS = frozenset({"poetry", "pip"})
+_VALID_OBSERVABILITY_TOOLS = frozenset({"langsmith", "wandb", None})
 
-@dataclass
+# (attribute, allowed values, label used in the error message)
+_VALIDATIONS: Tuple[Tuple[str, FrozenSet[Optional[str]], str], ...] = (
+    ("llm_provider", _VALID_LLM_PROVIDERS, "LLM provider"),
+    ("orchestrator", _VALID_ORCHESTRATORS, "orchestrator"),
+    ("vector_db", _VALID_VECTOR_DBS, "vector DB"),
+    ("ui_framework", _VALID_UI_FRAMEWORKS, "UI framework"),
+    ("dependency_manager", _VALID_DEPENDENCY_MANAGERS, "dependency manager"),
+    ("observability_tool", _VALID_OBSERVABILITY_TOOLS, "observability tool"),
+)
+
+# Every allowed value mapped to its literal, used to canonicalize input that
+# compares equal (e.g. str-based Enum members) to the interned constant
+_CANONICAL = {value: value for _, allowed, _ in _VALIDATIONS for value in allowed}
+
+
+@dataclass(frozen=True)
 class ProjectConfig:
     """Configuration for a GenAI project."""
     
@@ -20,22 +41,14 @@ class ProjectConfig:
     
     def __post_init__(self):
         """Validate configuration."""
-        valid_llm_providers = ["openai", "anthropic", "azure", "ollama", "local"]
-        valid_orchestrators = ["langchain", "llamaindex", "dspy", "none"]
-        valid_vector_dbs = ["pinecone", "chromadb", "qdrant", "pgvector"]
-        valid_ui_frameworks = ["streamlit", "gradio", "fastapi", "none"]
-        valid_dependency_managers = ["poetry", "pip"]
-        valid_observability_tools = ["langsmith", "wandb", None]
-        
-        if self.llm_provider not in valid_llm_providers:
-            raise ValueError(f"Invalid LLM provider: {self.llm_provider}")
-        if self.orchestrator not in valid_orchestrators:
-            raise ValueError(f"Invalid orchestrator: {self.orchestrator}")
-        if self.vector_db not in valid_vector_dbs:
-            raise ValueError(f"Invalid vector DB: {self.vector_db}")
-        if self.ui_framework not in valid_ui_frameworks:
-            raise ValueError(f"Invalid UI framework: {self.ui_framework}")
-        if self.dependency_manager not in valid_dependency_managers:
-            raise ValueError(f"Invalid dependency manager: {self.dependency_manager}")
-        if self.observability_tool not in valid_observability_tools:
-            raise ValueError(f"Invalid observability tool: {self.observability_tool}")
+        for attr, allowed, label in _VALIDATIONS:
+            value = getattr(self, attr)
+            try:
+                valid = value in allowed
+            except TypeError:  # unhashable, so it can't be an allowed value
+                valid = False
+            if not valid:
+                raise ValueError(f"Invalid {label}: {value}")
+            # Store the canonical literal so later equality checks hit the
+            # identity fast path
+            object.__setattr__(self, attr, _CANONICAL[value])
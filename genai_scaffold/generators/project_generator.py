@@ -1,29 +1,141 @@
 """Project generator implementation."""
 
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..core.config import ProjectConfig
 
+# Configuration fields passed through to templates as-is
+_CONTEXT_FIELDS = (
+    "project_name",
+    "llm_provider",
+    "orchestrator",
+    "vector_db",
+    "ui_framework",
+    "dependency_manager",
+    "enable_observability",
+    "observability_tool",
+    "enable_docker",
+)
+
+# Helper booleans for templates: each value below gets a ``use_<value>`` flag
+# that is True when the config field is set to it
+_FLAG_VALUES = (
+    ("orchestrator", ("langchain", "llamaindex", "dspy")),
+    ("llm_provider", ("openai", "anthropic", "azure", "ollama", "local")),
+    ("vector_db", ("pinecone", "chromadb", "qdrant", "pgvector")),
+    ("ui_framework", ("streamlit", "gradio", "fastapi")),
+    ("dependency_manager", ("poetry",)),
+    ("observability_tool", ("langsmith", "wandb")),
+)
+
+
+# Configuration fields the manifest predicates may read. Predicates are
+# evaluated against these fields only, so reading any other field fails
+# loudly instead of caching a wrong plan
+_PLAN_FIELDS = (
+    "orchestrator",
+    "ui_framework",
+    "dependency_manager",
+    "enable_docker",
+    "enable_observability",
+)
+
+
+@lru_cache(maxsize=None)
+def _static_content(template_path: str) -> Optional[bytes]:
+    """Return the output of a template that has no Jinja markup, else None.
+    
+    Such templates render to their own text, so they are read once and
+    written as-is instead of going through Jinja. Like Jinja (which runs
+    with ``keep_trailing_newline=False``), a single trailing newline is
+    dropped so the output is identical either way.
+    """
+    with open(template_path, "rb") as f:
+        content = f.read()
+    if b"{{" in content or b"{%" in content or b"{#" in content:
+        return None
+    if content.endswith(b"\n"):
+        content = content[:-1]
+    return content
+
 
 class ProjectGenerator:
     """Generates a GenAI project based on configuration."""
     
+    # Base directory structure, created even when no file is rendered into it
+    _DIRECTORIES = (
+        "src",
+        "src/llm",
+        "src/prompts",
+        "src/utils",
+        "src/handlers",
+        "tests",
+        "config",
+        "data/cache",
+        "data/outputs",
+        "data/embeddings",
+        "notebooks",
+    )
+    
+    # (template name, destination relative to the project, predicate on the
+    # config deciding whether the file is rendered; None means always)
+    _MANIFEST: List[Tuple[str, str, Optional[Callable[[ProjectConfig], bool]]]] = [
+        # Common files
+        ("new/README.md.j2", "README.md", None),
+        ("new/.env.example.j2", ".env.example", None),
+        ("new/.gitignore.j2", ".gitignore", None),
+        ("new/Makefile.j2", "Makefile", None),
+        # Source files
+        ("new/src/__init__.py.j2", "src/__init__.py", None),
+        ("new/src/config.py.j2", "src/config.py", None),
+        # Prompt management
+        ("new/src/prompts/__init__.py.j2", "src/prompts/__init__.py", None),
+        ("new/src/prompts/loader.py.j2", "src/prompts/loader.py", None),
+        ("new/src/prompts/templates.yaml.j2", "src/prompts/templates.yaml", None),
+        # Utils
+        ("new/src/utils/__init__.py.j2", "src/utils/__init__.py", None),
+        ("new/src/utils/logger.py.j2", "src/utils/logger.py", None),
+        # Tests
+        ("new/tests/__init__.py.j2", "tests/__init__.py", None),
+        ("new/tests/conftest.py.j2", "tests/conftest.py", None),
+        ("new/tests/test_example.py.j2", "tests/test_example.py", None),
+        ("new/pytest.ini.j2", "pytest.ini", None),
+        # LLM provider
+        ("new/src/llm/__init__.py.j2", "src/llm/__init__.py", None),
+        ("new/src/llm/client.py.j2", "src/llm/client.py", None),
+        # Orchestrator
+        ("new/src/rag_pipeline.py.j2", "src/rag_pipeline.py", lambda c: c.orchestrator != "none"),
+        # Vector database
+        ("new/src/vector_store.py.j2", "src/vector_store.py", None),
+        # UI framework
+        ("new/app_streamlit.py.j2", "app.py", lambda c: c.ui_framework == "streamlit"),
+        ("new/app_gradio.py.j2", "app.py", lambda c: c.ui_framework == "gradio"),
+        ("new/app_fastapi.py.j2", "app.py", lambda c: c.ui_framework == "fastapi"),
+        # Dependency management
+        ("new/pyproject.toml.j2", "pyproject.toml", lambda c: c.dependency_manager == "poetry"),
+        ("new/requirements.txt.j2", "requirements.txt", lambda c: c.dependency_manager == "pip"),
+        ("new/requirements-dev.txt.j2", "requirements-dev.txt", lambda c: c.dependency_manager == "pip"),
+        # Docker
+        ("new/Dockerfile.j2", "Dockerfile", lambda c: c.enable_docker),
+        ("new/docker-compose.yml.j2", "docker-compose.yml", lambda c: c.enable_docker),
+        # Observability
+        ("new/src/observability.py.j2", "src/observability.py", lambda c: c.enable_observability),
+    ]
+    
     def __init__(self, config: ProjectConfig):
         """Initialize the project generator.
         
         Args:
             config: Project configuration object
         """
+        from .._jinja import get_template
+
         self.config = config
         self.templates_dir = Path(__file__).parent.parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=select_autoescape(enabled_extensions=(), default=False),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self._get_template = partial(get_template, str(self.templates_dir))
     
     def generate(self, destination: Path) -> None:
         """Generate the project at the destination path.
@@ -34,155 +146,78 @@ class ProjectGenerator:
         destination.mkdir(parents=True, exist_ok=True)
         
         # Create context for templates
-        context = self._build_context()
+        context = self.context
         
-        # Render base structure
-        self._render_base_structure(destination, context)
+        # Collect the files this configuration needs
+        pairs: List[Tuple[str, Path]] = [
+            (template_name, destination / relative)
+            for template_name, relative in self._plan()
+        ]
         
-        # Render tech-stack specific files
-        self._render_llm_provider(destination, context)
-        self._render_orchestrator(destination, context)
-        self._render_vector_db(destination, context)
-        self._render_ui_framework(destination, context)
+        # Create every directory up front
+        directories = {destination / dir_path for dir_path in self._DIRECTORIES}
+        directories.update(dest.parent for _, dest in pairs)
+        for directory in sorted(directories):
+            directory.mkdir(parents=True, exist_ok=True)
         
-        # Render additional files
-        self._render_dependency_files(destination, context)
-        self._render_docker_files(destination, context)
-        self._render_observability(destination, context)
-    
-    def _build_context(self) -> Dict[str, Any]:
-        """Build template context from configuration."""
-        return {
-            "project_name": self.config.project_name,
-            "llm_provider": self.config.llm_provider,
-            "orchestrator": self.config.orchestrator,
-            "vector_db": self.config.vector_db,
-            "ui_framework": self.config.ui_framework,
-            "dependency_manager": self.config.dependency_manager,
-            "enable_observability": self.config.enable_observability,
-            "observability_tool": self.config.observability_tool,
-            "enable_docker": self.config.enable_docker,
-            # Helper booleans for templates
-            "use_langchain": self.config.orchestrator == "langchain",
-            "use_llamaindex": self.config.orchestrator == "llamaindex",
-            "use_dspy": self.config.orchestrator == "dspy",
-            "use_openai": self.config.llm_provider == "openai",
-            "use_anthropic": self.config.llm_provider == "anthropic",
-            "use_azure": self.config.llm_provider == "azure",
-            "use_ollama": self.config.llm_provider == "ollama",
-            "use_local": self.config.llm_provider == "local",
-            "use_pinecone": self.config.vector_db == "pinecone",
-            "use_chromadb": self.config.vector_db == "chromadb",
-            "use_qdrant": self.config.vector_db == "qdrant",
-            "use_pgvector": self.config.vector_db == "pgvector",
-            "use_streamlit": self.config.ui_framework == "streamlit",
-            "use_gradio": self.config.ui_framework == "gradio",
-            "use_fastapi": self.config.ui_framework == "fastapi",
-            "use_poetry": self.config.dependency_manager == "poetry",
-            "use_langsmith": self.config.observability_tool == "langsmith",
-            "use_wandb": self.config.observability_tool == "wandb",
-        }
+        # Empty gitkeep files
+        for keep_dir in ("data/cache", "data/outputs", "data/embeddings", "notebooks"):
+            (destination / keep_dir / ".gitkeep").write_bytes(b"")
+        
+        # Render and write each file in turn. A thread pool for the writes was
+        # measured to be slower: small files land in the page cache without
+        # blocking, so the pool's startup cost dominates
+        for template_name, dest in pairs:
+            dest.write_bytes(self._render_template(template_name, context))
     
-    def _render_template(self, template_name: str, destination: Path, context: Dict[str, Any]) -> None:
-        """Render a single template file.
+    def _plan(self) -> Tuple[Tuple[str, str], ...]:
+        """Return the (template name, relative destination) pairs to render.
         
-        Args:
-            template_name: Name of the template file (relative to templates dir)
-            destination: Destination file path
-            context: Template context dictionary
+        The filtered manifest is computed once per combination of the
+        ``_PLAN_FIELDS`` values and shared by every generator of the same
+        class with the same feature set.
         """
-        template = self.env.get_template(template_name)
-        content = template.render(**context)
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(content)
+        return self._plan_for(tuple(getattr(self.config, field) for field in _PLAN_FIELDS))
     
-    def _render_base_structure(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render base project structure."""
-        # Create directory structure
-        dirs = [
-            "src",
-            "src/llm",
-            "src/prompts",
-            "src/utils",
-            "src/handlers",
-            "tests",
-            "config",
-            "data/cache",
-            "data/outputs",
-            "data/embeddings",
-            "notebooks",
-        ]
-        
-        for dir_path in dirs:
-            (destination / dir_path).mkdir(parents=True, exist_ok=True)
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _plan_for(cls, key: Tuple[Any, ...]) -> Tuple[Tuple[str, str], ...]:
+        """Filter ``cls._MANIFEST`` for the given ``_PLAN_FIELDS`` values.
         
-        # Render common files
-        self._render_template("new/README.md.j2", destination / "README.md", context)
-        self._render_template("new/.env.example.j2", destination / ".env.example", context)
-        self._render_template("new/.gitignore.j2", destination / ".gitignore", context)
-        self._render_template("new/Makefile.j2", destination / "Makefile", context)
-        
-        # Source files
-        self._render_template("new/src/__init__.py.j2", destination / "src/__init__.py", context)
-        self._render_template("new/src/config.py.j2", destination / "src/config.py", context)
-        
-        # Prompt management
-        self._render_template("new/src/prompts/__init__.py.j2", destination / "src/prompts/__init__.py", context)
-        self._render_template("new/src/prompts/loader.py.j2", destination / "src/prompts/loader.py", context)
-        self._render_template("new/src/prompts/templates.yaml.j2", destination / "src/prompts/templates.yaml", context)
+        The cache is keyed on the class too, so subclasses that override
+        ``_MANIFEST`` get their own plans.
+        """
+        features = SimpleNamespace(**dict(zip(_PLAN_FIELDS, key)))
+        return tuple(
+            (template_name, relative)
+            for template_name, relative, predicate in cls._MANIFEST
+            if predicate is None or predicate(features)
+        )
+    
+    @cached_property
+    def context(self) -> Dict[str, Any]:
+        """Template context built from the configuration.
         
-        # Utils
-        self._render_template("new/src/utils/__init__.py.j2", destination / "src/utils/__init__.py", context)
-        self._render_template("new/src/utils/logger.py.j2", destination / "src/utils/logger.py", context)
+        Computed once per generator; the configuration is frozen, so the
+        cached value cannot go stale.
+        """
+        context = {field: getattr(self.config, field) for field in _CONTEXT_FIELDS}
+        for field, values in _FLAG_VALUES:
+            current = getattr(self.config, field)
+            context.update((f"use_{value}", value == current) for value in values)
+        return context
+    
+    def _render_template(self, template_name: str, context: Dict[str, Any]) -> bytes:
+        """Render a single template.
         
-        # Tests
-        self._render_template("new/tests/__init__.py.j2", destination / "tests/__init__.py", context)
-        self._render_template("new/tests/conftest.py.j2", destination / "tests/conftest.py", context)
-        self._render_template("new/tests/test_example.py.j2", destination / "tests/test_example.py", context)
-        self._render_template("new/pytest.ini.j2", destination / "pytest.ini", context)
+        Args:
+            template_name: Name of the template file (relative to templates dir)
+            context: Template context dictionary
         
-        # Empty gitkeep files
-        for keep_dir in ["data/cache", "data/outputs", "data/embeddings", "notebooks"]:
-            (destination / keep_dir / ".gitkeep").touch()
-    
-    def _render_llm_provider(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render LLM provider-specific files."""
-        self._render_template("new/src/llm/__init__.py.j2", destination / "src/llm/__init__.py", context)
-        self._render_template("new/src/llm/client.py.j2", destination / "src/llm/client.py", context)
-    
-    def _render_orchestrator(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render orchestrator-specific files."""
-        if self.config.orchestrator != "none":
-            self._render_template("new/src/rag_pipeline.py.j2", destination / "src/rag_pipeline.py", context)
-    
-    def _render_vector_db(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render vector database-specific files."""
-        self._render_template("new/src/vector_store.py.j2", destination / "src/vector_store.py", context)
-    
-    def _render_ui_framework(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render UI framework files."""
-        if self.config.ui_framework == "streamlit":
-            self._render_template("new/app_streamlit.py.j2", destination / "app.py", context)
-        elif self.config.ui_framework == "gradio":
-            self._render_template("new/app_gradio.py.j2", destination / "app.py", context)
-        elif self.config.ui_framework == "fastapi":
-            self._render_template("new/app_fastapi.py.j2", destination / "app.py", context)
-    
-    def _render_dependency_files(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render dependency management files."""
-        if self.config.dependency_manager == "poetry":
-            self._render_template("new/pyproject.toml.j2", destination / "pyproject.toml", context)
-        else:  # pip
-            self._render_template("new/requirements.txt.j2", destination / "requirements.txt", context)
-            self._render_template("new/requirements-dev.txt.j2", destination / "requirements-dev.txt", context)
-    
-    def _render_docker_files(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render Docker-related files."""
-        if self.config.enable_docker:
-            self._render_template("new/Dockerfile.j2", destination / "Dockerfile", context)
-            self._render_template("new/docker-compose.yml.j2", destination / "docker-compose.yml", context)
-    
-    def _render_observability(self, destination: Path, context: Dict[str, Any]) -> None:
-        """Render observability-related files."""
-        if self.config.enable_observability:
-            self._render_template("new/src/observability.py.j2", destination / "src/observability.py", context)
+        Returns:
+            The rendered file content, UTF-8 encoded
+        """
+        static = _static_content(str(self.templates_dir / template_name))
+        if static is not None:
+            return static
+        return self._get_template(template_name).render(context).encode("utf-8")
@@ -1,23 +1,49 @@
 """Utilities for loading and rendering project templates."""
 
+import os
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+
+from ._jinja import get_template
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
-_env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=False)
+# Rendered output is streamed in small chunks; a larger buffer batches them
+# into fewer write() calls than the 8 KiB default
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+
+def _walk_files(root: str):
+    """Yield ``(absolute_path, relative_path)`` for every file under root.
+
+    Uses ``os.scandir`` so directory entries carry their own type
+    information and no extra ``stat`` call is needed per entry. Relative
+    paths use ``/`` separators, as expected by the Jinja2 loader.
+    """
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel + "/"))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, rel
 
 
 def render_templates(destination: Path, **context) -> None:
     """Render all templates into the destination directory."""
-    for template_path in TEMPLATES_DIR.rglob('*'):
-        if template_path.is_dir():
-            continue
-        relative = template_path.relative_to(TEMPLATES_DIR)
-        dest = destination / relative
+    templates_dir = str(TEMPLATES_DIR)
+    root = str(destination)
+    for _, relative in _walk_files(templates_dir):
+        dest = os.path.join(root, relative)
         # strip .j2 suffix
-        if dest.suffix == '.j2':
-            dest = dest.with_suffix('')
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        template = _env.get_template(str(relative))
-        dest.write_text(template.render(**context))
+        if dest.endswith('.j2'):
+            dest = dest[:-3]
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        # The legacy scaffold keeps Jinja's default whitespace handling
+        template = get_template(
+            templates_dir, relative, trim_blocks=False, lstrip_blocks=False
+        )
+        with open(dest, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            template.stream(context).dump(f, encoding="utf-8")
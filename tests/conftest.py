@@ -0,0 +1,63 @@
+"""Shared fixtures for the genai_scaffold test suite."""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+from genai_scaffold.generators.project_generator import ProjectGenerator
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        default=False,
+        help="run the perf-marked benchmarks",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect perf benchmarks unless they were asked for.
+    
+    Benchmarks run with ``--run-perf`` or when the ``-m`` expression mentions
+    ``perf``; any other marker expression combines with this as usual.
+    """
+    if config.getoption("--run-perf") or "perf" in (config.getoption("-m") or ""):
+        return
+    selected, deselected = [], []
+    for item in items:
+        (deselected if item.get_closest_marker("perf") else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def _tree(root: Path) -> set:
+    """Return every path under root, relative and with forward slashes."""
+    return {p.relative_to(root).as_posix() for p in root.rglob("*")}
+
+
+@pytest.fixture(scope="session")
+def tree():
+    """Return a helper that lists a directory tree in a single walk."""
+    return _tree
+
+
+@pytest.fixture(scope="session")
+def generated_project(tmp_path_factory):
+    """Generate a project once per unique configuration and reuse it.
+    
+    Returns a callable that takes a ``ProjectConfig`` and returns the path of
+    the generated project. Only use it for tests that don't modify the output.
+    """
+    cache = {}
+    
+    def _generate(config):
+        key = tuple(sorted(asdict(config).items()))
+        if key not in cache:
+            destination = tmp_path_factory.mktemp("proj") / config.project_name
+            ProjectGenerator(config).generate(destination)
+            cache[key] = destination
+        return cache[key]
+    
+    return _generate
@@ -1,5 +1,8 @@
 """Tests for the core configuration module."""
 
+from dataclasses import FrozenInstanceError
+from enum import Enum
+
 import pytest
 from genai_scaffold.core.config import ProjectConfig
 
@@ -60,6 +63,18 @@ def test_project_config_invalid_vector_db():
         )
 
 
+def test_project_config_unhashable_value():
+    """Test that an unhashable value raises ValueError, not TypeError."""
+    with pytest.raises(ValueError, match="Invalid LLM provider"):
+        ProjectConfig(
+            project_name="test-app",
+            llm_provider=["openai"],
+            orchestrator="langchain",
+            vector_db="chromadb",
+            ui_framework="streamlit",
+        )
+
+
 def test_project_config_with_observability():
     """Test configuration with observability enabled."""
     config = ProjectConfig(
@@ -76,6 +91,37 @@ def test_project_config_with_observability():
     assert config.observability_tool == "langsmith"
 
 
+def test_project_config_is_frozen():
+    """Test that a configuration cannot be modified after creation."""
+    config = ProjectConfig(
+        project_name="test-app",
+        llm_provider="openai",
+        orchestrator="langchain",
+        vector_db="chromadb",
+        ui_framework="streamlit",
+    )
+    
+    with pytest.raises(FrozenInstanceError):
+        config.llm_provider = "anthropic"
+
+
+def test_project_config_accepts_str_enum_values():
+    """Test that str-based Enum members are accepted and stored as plain strings."""
+    class Provider(str, Enum):
+        openai = "openai"
+    
+    config = ProjectConfig(
+        project_name="test-app",
+        llm_provider=Provider.openai,
+        orchestrator="langchain",
+        vector_db="chromadb",
+        ui_framework="streamlit",
+    )
+    
+    assert config.llm_provider == "openai"
+    assert type(config.llm_provider) is str
+
+
 def test_project_config_all_providers():
     """Test all valid LLM providers."""
     providers = ["openai", "anthropic", "azure", "ollama", "local"]
@@ -1,14 +1,31 @@
 """Tests for the ProjectGenerator class."""
 
+import os
+from functools import lru_cache
+
 import pytest
 from pathlib import Path
 from genai_scaffold.core.config import ProjectConfig
-from genai_scaffold.generators.project_generator import ProjectGenerator
+from genai_scaffold._jinja import get_env
+from genai_scaffold.generators.project_generator import (
+    _PLAN_FIELDS,
+    ProjectGenerator,
+    _static_content,
+)
+
+
+@lru_cache(maxsize=None)
+def _cfg(**kwargs) -> ProjectConfig:
+    """Build a ProjectConfig, reusing the instance for identical arguments.
+    
+    Safe to share because ProjectConfig is frozen.
+    """
+    return ProjectConfig(**kwargs)
 
 
-def test_project_generator_basic(tmp_path):
+def test_project_generator_basic(generated_project, tree):
     """Test basic project generation."""
-    config = ProjectConfig(
+    config = _cfg(
         project_name="test-app",
         llm_provider="openai",
         orchestrator="langchain",
@@ -19,35 +36,33 @@ def test_project_generator_basic(tmp_path):
         enable_observability=False,
     )
     
-    generator = ProjectGenerator(config)
-    destination = tmp_path / "test-app"
-    
-    generator.generate(destination)
+    destination = generated_project(config)
     
     # Check that the directory was created
-    assert destination.exists()
+    assert os.path.isdir(os.fspath(destination))
+    files = tree(destination)
     
     # Check key files
-    assert (destination / "README.md").exists()
-    assert (destination / ".env.example").exists()
-    assert (destination / "Makefile").exists()
-    assert (destination / "requirements.txt").exists()
-    assert (destination / "docker-compose.yml").exists()
+    assert "README.md" in files
+    assert ".env.example" in files
+    assert "Makefile" in files
+    assert "requirements.txt" in files
+    assert "docker-compose.yml" in files
     
     # Check source structure
-    assert (destination / "src" / "__init__.py").exists()
-    assert (destination / "src" / "config.py").exists()
-    assert (destination / "src" / "llm" / "client.py").exists()
-    assert (destination / "src" / "prompts" / "loader.py").exists()
-    assert (destination / "src" / "vector_store.py").exists()
+    assert "src/__init__.py" in files
+    assert "src/config.py" in files
+    assert "src/llm/client.py" in files
+    assert "src/prompts/loader.py" in files
+    assert "src/vector_store.py" in files
     
     # Check tests
-    assert (destination / "tests" / "test_example.py").exists()
+    assert "tests/test_example.py" in files
 
 
-def test_project_generator_with_poetry(tmp_path):
+def test_project_generator_with_poetry(generated_project):
     """Test project generation with Poetry."""
-    config = ProjectConfig(
+    config = _cfg(
         project_name="test-app",
         llm_provider="openai",
         orchestrator="langchain",
@@ -58,19 +73,16 @@ def test_project_generator_with_poetry(tmp_path):
         enable_observability=False,
     )
     
-    generator = ProjectGenerator(config)
-    destination = tmp_path / "test-app"
-    
-    generator.generate(destination)
+    dest = os.fspath(generated_project(config))
     
     # Should have pyproject.toml instead of requirements.txt
-    assert (destination / "pyproject.toml").exists()
-    assert not (destination / "requirements.txt").exists()
+    assert os.path.exists(os.path.join(dest, "pyproject.toml"))
+    assert not os.path.exists(os.path.join(dest, "requirements.txt"))
 
 
-def test_project_generator_without_docker(tmp_path):
+def test_project_generator_without_docker(generated_project):
     """Test project generation without Docker."""
-    config = ProjectConfig(
+    config = _cfg(
         project_name="test-app",
         llm_provider="openai",
         orchestrator="langchain",
@@ -80,19 +92,16 @@ def test_project_generator_without_docker(tmp_path):
         enable_observability=False,
     )
     
-    generator = ProjectGenerator(config)
-    destination = tmp_path / "test-app"
-    
-    generator.generate(destination)
+    dest = os.fspath(generated_project(config))
     
     # Should not have Docker files
-    assert not (destination / "Dockerfile").exists()
-    assert not (destination / "docker-compose.yml").exists()
+    assert not os.path.exists(os.path.join(dest, "Dockerfile"))
+    assert not os.path.exists(os.path.join(dest, "docker-compose.yml"))
 
 
-def test_project_generator_with_observability(tmp_path):
+def test_project_generator_with_observability(generated_project):
     """Test project generation with observability."""
-    config = ProjectConfig(
+    config = _cfg(
         project_name="test-app",
         llm_provider="openai",
         orchestrator="langchain",
@@ -102,18 +111,15 @@ def test_project_generator_with_observability(tmp_path):
         observability_tool="langsmith",
     )
     
-    generator = ProjectGenerator(config)
-    destination = tmp_path / "test-app"
-    
-    generator.generate(destination)
+    dest = os.fspath(generated_project(config))
     
     # Should have observability file
-    assert (destination / "src" / "observability.py").exists()
+    assert os.path.exists(os.path.join(dest, "src", "observability.py"))
 
 
-def test_project_generator_fastapi(tmp_path):
+def test_project_generator_fastapi(generated_project):
     """Test project generation with FastAPI."""
-    config = ProjectConfig(
+    config = _cfg(
         project_name="test-app",
         llm_provider="openai",
         orchestrator="langchain",
@@ -121,22 +127,20 @@ def test_project_generator_fastapi(tmp_path):
         ui_framework="fastapi",
     )
     
-    generator = ProjectGenerator(config)
-    destination = tmp_path / "test-app"
-    
-    generator.generate(destination)
+    dest = os.fspath(generated_project(config))
     
     # Should have app.py for FastAPI
-    assert (destination / "app.py").exists()
+    assert os.path.exists(os.path.join(dest, "app.py"))
     
     # Check that app.py contains FastAPI code
-    content = (destination / "app.py").read_text()
-    assert "FastAPI" in content
+    with open(os.path.join(dest, "app.py"), "rb") as f:
+        content = f.read()
+    assert b"FastAPI" in content
 
 
-def test_project_generator_context_building(tmp_path):
+def test_project_generator_context_building():
     """Test that the context is built correctly."""
-    config = ProjectConfig(
+    config = _cfg(
         project_name="test-app",
         llm_provider="openai",
         orchestrator="langchain",
@@ -145,7 +149,7 @@ def test_project_generator_context_building(tmp_path):
     )
     
     generator = ProjectGenerator(config)
-    context = generator._build_context()
+    context = generator.context
     
     # Check basic fields
     assert context["project_name"] == "test-app"
@@ -161,9 +165,9 @@ def test_project_generator_context_building(tmp_path):
     assert context["use_anthropic"] is False
 
 
-def test_project_generator_readme_content(tmp_path):
+def test_project_generator_readme_content(generated_project):
     """Test that README contains correct information."""
-    config = ProjectConfig(
+    config = _cfg(
         project_name="my-rag-app",
         llm_provider="anthropic",
         orchestrator="llamaindex",
@@ -171,16 +175,89 @@ def test_project_generator_readme_content(tmp_path):
         ui_framework="gradio",
     )
     
-    generator = ProjectGenerator(config)
-    destination = tmp_path / "my-rag-app"
-    
-    generator.generate(destination)
+    dest = os.fspath(generated_project(config))
     
-    readme_content = (destination / "README.md").read_text()
+    with open(os.path.join(dest, "README.md"), "rb") as f:
+        readme_content = f.read()
     
     # Check that all the config is mentioned
-    assert "my-rag-app" in readme_content
-    assert "anthropic" in readme_content
-    assert "llamaindex" in readme_content
-    assert "pinecone" in readme_content
-    assert "gradio" in readme_content
+    assert b"my-rag-app" in readme_content
+    assert b"anthropic" in readme_content
+    assert b"llamaindex" in readme_content
+    assert b"pinecone" in readme_content
+    assert b"gradio" in readme_content
+
+
+def test_project_generator_plan_shared_across_projects():
+    """Test that configs with the same feature set share one file plan."""
+    first = _cfg(
+        project_name="first-app",
+        llm_provider="openai",
+        orchestrator="none",
+        vector_db="chromadb",
+        ui_framework="gradio",
+    )
+    second = _cfg(
+        project_name="second-app",
+        llm_provider="anthropic",
+        orchestrator="none",
+        vector_db="qdrant",
+        ui_framework="gradio",
+    )
+    
+    plan = ProjectGenerator(first)._plan()
+    
+    assert ProjectGenerator(second)._plan() is plan
+    assert ("new/app_gradio.py.j2", "app.py") in plan
+    assert all(template != "new/src/rag_pipeline.py.j2" for template, _ in plan)
+
+
+def test_project_generator_plan_per_subclass():
+    """Test that a subclass overriding the manifest gets its own plan."""
+    class MinimalGenerator(ProjectGenerator):
+        _MANIFEST = [("new/README.md.j2", "README.md", None)]
+    
+    config = _cfg(
+        project_name="test-app",
+        llm_provider="openai",
+        orchestrator="langchain",
+        vector_db="chromadb",
+        ui_framework="streamlit",
+    )
+    
+    assert len(ProjectGenerator(config)._plan()) > 1
+    assert MinimalGenerator(config)._plan() == (("new/README.md.j2", "README.md"),)
+
+
+def test_project_generator_manifest_predicates_use_plan_fields():
+    """Test that every manifest predicate only reads fields in _PLAN_FIELDS."""
+    class Recorder:
+        def __init__(self):
+            self.seen = set()
+        
+        def __getattr__(self, name):
+            self.seen.add(name)
+            return None
+    
+    for template_name, _, predicate in ProjectGenerator._MANIFEST:
+        if predicate is None:
+            continue
+        recorder = Recorder()
+        predicate(recorder)
+        assert recorder.seen <= set(_PLAN_FIELDS), template_name
+
+
+def test_project_generator_static_templates_match_jinja():
+    """Test that templates written without Jinja match what Jinja would render."""
+    templates_dir = Path(__file__).parent.parent / "genai_scaffold" / "templates"
+    env = get_env(str(templates_dir))
+    
+    static_templates = 0
+    for template_name, _, _ in ProjectGenerator._MANIFEST:
+        content = _static_content(str(templates_dir / template_name))
+        if content is None:
+            continue
+        static_templates += 1
+        assert content == env.get_template(template_name).render().encode("utf-8"), template_name
+    
+    assert static_templates > 0
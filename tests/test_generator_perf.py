@@ -0,0 +1,32 @@
+"""Benchmarks for the ProjectGenerator hot path.
+
+Requires pytest-benchmark; the module is skipped when it isn't installed.
+Deselected by default; run the benchmarks with ``pytest -m perf``.
+"""
+
+import pytest
+from genai_scaffold.core.config import ProjectConfig
+from genai_scaffold.generators.project_generator import ProjectGenerator
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.perf
+def test_generate_perf(benchmark, tmp_path):
+    """Benchmark generating a project with a representative configuration."""
+    config = ProjectConfig(
+        project_name="bench-app",
+        llm_provider="openai",
+        orchestrator="langchain",
+        vector_db="chromadb",
+        ui_framework="streamlit",
+        enable_docker=True,
+        enable_observability=True,
+        observability_tool="langsmith",
+    )
+    generator = ProjectGenerator(config)
+    destination = tmp_path / "bench-app"
+    
+    benchmark(generator.generate, destination)
+    
+    assert (destination / "README.md").exists()
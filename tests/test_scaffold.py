@@ -1,43 +1,156 @@
+import os
 import subprocess
 import sys
-from pathlib import Path
+import types
 
-def test_module_execution_creates_project(tmp_path):
-    project_path = tmp_path / 'proj'
-    result = subprocess.run(
-        [sys.executable, '-m', 'genai_scaffold', 'create', str(project_path), 
-         '--provider', 'anthropic', '--orchestrator', 'langchain', 
-         '--vector-db', 'chromadb', '--ui', 'streamlit'],
-        capture_output=True, text=True
+import pytest
+from typer.testing import CliRunner
+
+from genai_scaffold import __main__, __version__
+from genai_scaffold.cli import app, interactive_config
+
+COMMON_ARGS = ['--orchestrator', 'langchain', '--vector-db', 'chromadb', '--ui', 'streamlit']
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """One temporary root for every project generated in this module."""
+    return tmp_path_factory.mktemp("scaffold")
+
+
+@pytest.fixture(scope="module", params=["anthropic", "openai"])
+def cli_project(request, shared_tmp):
+    """Create one project per provider through the CLI and share it."""
+    provider = request.param
+    project_path = shared_tmp / provider
+    result = CliRunner().invoke(
+        app, ['create', str(project_path), '--provider', provider, *COMMON_ARGS]
     )
-    assert result.returncode == 0, f"Command failed: {result.stderr}"
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+    return provider, project_path
+
+
+@pytest.fixture(scope="module")
+def project_files(cli_project, tree):
+    """Relative paths of everything in the generated project, walked once."""
+    _, project_path = cli_project
+    return tree(project_path)
+
+
+def test_project_created(cli_project):
+    _, project_path = cli_project
+    assert os.path.isdir(os.fspath(project_path)), "Project directory was not created"
+
+
+def test_readme_mentions_provider(cli_project):
+    provider, project_path = cli_project
+    readme = os.path.join(os.fspath(project_path), 'README.md')
+    assert os.path.exists(readme), "README.md not found"
+    with open(readme, 'rb') as f:
+        assert provider.encode() in f.read().lower(), "Provider not found in README"
+
+
+def test_key_files(project_files):
+    assert '.env.example' in project_files, ".env.example not found"
+    assert 'Makefile' in project_files, "Makefile not found"
+    assert 'requirements.txt' in project_files, "requirements.txt not found"
+    assert 'docker-compose.yml' in project_files, "docker-compose.yml not found"
+
+
+def test_source_structure(project_files):
+    assert 'src' in project_files, "src directory not found"
+    assert 'src/llm/client.py' in project_files, "LLM client not found"
+    assert 'src/prompts/loader.py' in project_files, "Prompt loader not found"
+    assert 'src/vector_store.py' in project_files, "Vector store not found"
+    assert 'src/rag_pipeline.py' in project_files, "RAG pipeline not found"
+
+
+def test_tests_directory(project_files):
+    assert 'tests' in project_files, "tests directory not found"
+    assert 'tests/test_example.py' in project_files, "test_example.py not found"
+    assert 'tests/conftest.py' in project_files, "conftest.py not found"
+
+
+@pytest.mark.parametrize("arg", ["version", "--version", "-V"])
+def test_version_fast_path_skips_typer(arg, monkeypatch, capsys):
+    # Forget the CLI stack so we can see whether the fast path imports it
+    for name in list(sys.modules):
+        if name.split('.')[0] in ('typer', 'rich', 'click') or name == 'genai_scaffold.cli':
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(sys, 'argv', ['genai-scaffold', arg])
     
-    # Check that the project was created
-    assert project_path.exists(), "Project directory was not created"
+    __main__.main()
     
-    readme = (project_path / 'README.md')
-    assert readme.exists(), "README.md not found"
-    readme_content = readme.read_text()
-    assert 'anthropic' in readme_content.lower(), "Provider not found in README"
+    assert capsys.readouterr().out == f"genai-scaffold version {__version__}\n"
+    assert 'typer' not in sys.modules
+    assert 'genai_scaffold.cli' not in sys.modules
+
+
+@pytest.mark.parametrize("args", [["--version"], ["-V"], ["--version", "create"], ["version"]])
+def test_version_through_typer(args):
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+    assert f"version {__version__}" in result.output
+
+
+def _stub_inquirerpy(monkeypatch, replies):
+    """Install a fake InquirerPy that answers prompts from ``replies``.
     
-    # Check key files exist
-    assert (project_path / '.env.example').exists(), ".env.example not found"
-    assert (project_path / 'Makefile').exists(), "Makefile not found"
-    assert (project_path / 'requirements.txt').exists(), "requirements.txt not found"
-    assert (project_path / 'docker-compose.yml').exists(), "docker-compose.yml not found"
+    Like the real ``prompt``, questions whose ``when`` callback returns a
+    falsy value are skipped and left out of the answers.
+    """
+    def prompt(questions):
+        answers = {}
+        for question in questions:
+            when = question.get('when')
+            if when is not None and not when(answers):
+                continue
+            answers[question['name']] = replies[question['name']]
+        return answers
     
-    # Check source structure
-    src_dir = project_path / 'src'
-    assert src_dir.exists(), "src directory not found"
-    assert (src_dir / 'llm' / 'client.py').exists(), "LLM client not found"
-    assert (src_dir / 'prompts' / 'loader.py').exists(), "Prompt loader not found"
-    assert (src_dir / 'vector_store.py').exists(), "Vector store not found"
-    assert (src_dir / 'rag_pipeline.py').exists(), "RAG pipeline not found"
+    control = types.ModuleType('InquirerPy.base.control')
+    control.Choice = lambda value, name=None: value
+    base = types.ModuleType('InquirerPy.base')
+    base.control = control
+    inquirerpy = types.ModuleType('InquirerPy')
+    inquirerpy.prompt = prompt
+    inquirerpy.base = base
+    monkeypatch.setitem(sys.modules, 'InquirerPy', inquirerpy)
+    monkeypatch.setitem(sys.modules, 'InquirerPy.base', base)
+    monkeypatch.setitem(sys.modules, 'InquirerPy.base.control', control)
+
+
+INTERACTIVE_REPLIES = {
+    'project_name': 'my-app',
+    'llm_provider': 'openai',
+    'orchestrator': 'langchain',
+    'vector_db': 'chromadb',
+    'ui_framework': 'streamlit',
+    'dependency_manager': 'pip',
+    'enable_docker': True,
+    'observability_tool': 'wandb',
+}
+
+
+@pytest.mark.parametrize("enabled, expected_tool", [(False, None), (True, 'wandb')])
+def test_interactive_config_observability_tool(enabled, expected_tool, monkeypatch):
+    _stub_inquirerpy(monkeypatch, {**INTERACTIVE_REPLIES, 'enable_observability': enabled})
+    
+    config = interactive_config()
     
-    # Check tests exist
-    tests_dir = project_path / 'tests'
-    assert tests_dir.exists(), "tests directory not found"
-    assert (tests_dir / 'test_example.py').exists(), "test_example.py not found"
-    assert (tests_dir / 'conftest.py').exists(), "conftest.py not found"
+    assert config.enable_observability is enabled
+    assert config.observability_tool == expected_tool
+
+
+@pytest.mark.slow
+def test_module_execution_creates_project(shared_tmp):
+    project_path = shared_tmp / 'module-execution'
+    result = subprocess.run(
+        [sys.executable, '-m', 'genai_scaffold', 'create', str(project_path),
+         '--provider', 'anthropic', *COMMON_ARGS],
+        capture_output=True
+    )
+    assert result.returncode == 0, f"Command failed: {result.stderr.decode(errors='replace')}"
+    assert b'anthropic' in (project_path / 'README.md').read_bytes().lower()
 
 # test_scaffold.py - part of genai_scaffold
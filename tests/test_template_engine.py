@@ -0,0 +1,16 @@
+"""Tests for the legacy template engine."""
+
+from jinja2 import Environment, FileSystemLoader
+from genai_scaffold.template_engine import TEMPLATES_DIR, render_templates
+
+
+def test_render_templates_keeps_default_whitespace(tmp_path):
+    """Test that output matches a plain Jinja2 environment, blank lines included."""
+    render_templates(tmp_path, project_name="test-app", llm_provider="openai")
+    
+    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=False)
+    for name in ("new/Makefile.j2", "new/README.md.j2", "new/src/config.py.j2"):
+        expected = env.get_template(name).render(
+            project_name="test-app", llm_provider="openai"
+        )
+        assert (tmp_path / name[:-3]).read_text(encoding="utf-8") == expected